@@ -1,13 +1,17 @@
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from aiida.manage.configuration import load_profile
 from rich.console import Console
 from rich.traceback import install as install_rich_traceback
 
-from sirocco import core, parsing, pretty_print, vizgraph
-from sirocco.workgraph import AiidaWorkGraph
+from sirocco import core, parsing
+
+if TYPE_CHECKING:
+    from sirocco.workgraph import AiidaWorkGraph
+
+# NOTE: AiiDA, the workgraph and the visualization backends are imported inside the commands that use them, loading
+#       them at module level makes every invocation slow, including `--help` and `verify`.
 
 # --- Typer App and Rich Console Setup ---
 # Print tracebacks with syntax highlighting and rich formatting
@@ -23,14 +27,18 @@ app = typer.Typer(
 console = Console()
 
 
-def _create_aiida_workflow(workflow_file: Path) -> AiidaWorkGraph:
+def _create_aiida_workflow(workflow_file: Path) -> "AiidaWorkGraph":
+    from aiida.manage.configuration import load_profile
+
+    from sirocco.workgraph import AiidaWorkGraph
+
     load_profile()
     config_workflow = parsing.ConfigWorkflow.from_config_file(str(workflow_file))
     core_wf = core.Workflow.from_config_workflow(config_workflow)
     return AiidaWorkGraph(core_wf)
 
 
-def create_aiida_workflow(workflow_file: Path) -> AiidaWorkGraph:
+def create_aiida_workflow(workflow_file: Path) -> "AiidaWorkGraph":
     """Helper to prepare AiidaWorkGraph from workflow file."""
 
     from aiida.common import ProfileConfigurationError
@@ -110,6 +118,8 @@ def visualize(
     """
     Generate an interactive SVG visualization of the unrolled workflow.
     """
+    from sirocco import vizgraph
+
     console.print(f"📊 Visualizing workflow from: [cyan]{workflow_file!s}[/cyan]")
     try:
         # Load configuration
@@ -155,6 +165,8 @@ def represent(
     """
     Display the text representation of the unrolled workflow graph.
     """
+    from sirocco import pretty_print
+
     console.print(f"📄 Representing workflow from: [cyan]{workflow_file}[/cyan]")
     try:
         config_workflow = parsing.ConfigWorkflow.from_config_file(str(workflow_file))
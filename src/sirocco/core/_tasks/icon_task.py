@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import stat
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, ClassVar, Self
 
@@ -22,13 +23,10 @@ class IconTask(models.ConfigIconTaskSpecs, Task):
 
     def __post_init__(self):
         super().__post_init__()
+        # iterate in reverse so that, like a linear search, the first namelist wins when names repeat
+        namelists_by_name = {namelist.name: namelist for namelist in reversed(self.namelists)}
         # detect master namelist
-        master_namelist = None
-        for namelist in self.namelists:
-            if namelist.name == self._MASTER_NAMELIST_NAME:
-                master_namelist = namelist
-                break
-        if master_namelist is None:
+        if (master_namelist := namelists_by_name.get(self._MASTER_NAMELIST_NAME)) is None:
             msg = f"Failed to read master namelists. Could not find {self._MASTER_NAMELIST_NAME!r} in namelists {self.namelists}"
             raise ValueError(msg)
         self._master_namelist = master_namelist
@@ -42,12 +40,7 @@ class IconTask(models.ConfigIconTaskSpecs, Task):
             raise ValueError(msg)
 
         # detect model namelist
-        model_namelist = None
-        for namelist in self.namelists:
-            if namelist.name == model_namelist_filename:
-                model_namelist = namelist
-                break
-        if model_namelist is None:
+        if (model_namelist := namelists_by_name.get(model_namelist_filename)) is None:
             msg = f"Failed to read model namelist. Could not find {model_namelist_filename!r} in namelists {self.namelists}"
             raise ValueError(msg)
         self._model_namelist = model_namelist
@@ -70,6 +63,7 @@ class IconTask(models.ConfigIconTaskSpecs, Task):
         if not isinstance(self.cycle_point, DateCyclePoint):
             msg = "ICON task must have a DateCyclePoint"
             raise TypeError(msg)
+        is_restart = self.is_restart
         self.master_namelist.update_from_specs(
             {
                 "master_time_control_nml": {
@@ -77,22 +71,25 @@ class IconTask(models.ConfigIconTaskSpecs, Task):
                     "experimentStopDate": self.cycle_point.stop_date.isoformat() + "Z",
                     "restarttimeintval": str(self.cycle_point.period),
                 },
-                "master_nml": {"lrestart": self.is_restart, "read_restart_namelists": self.is_restart},
+                "master_nml": {"lrestart": is_restart, "read_restart_namelists": is_restart},
             }
         )
 
     def dump_namelists(self, directory: Path):
-        if not directory.exists():
+        # a single stat call replaces the separate exists() and is_dir() checks, like exists()
+        # any path that cannot be reached (ENOTDIR, ELOOP, ...) is reported as missing
+        try:
+            directory_stat = directory.stat()
+        except OSError as err:
             msg = f"Dumping path {directory} does not exist."
-            raise OSError(msg)
-        if not directory.is_dir():
+            raise OSError(msg) from err
+        if not stat.S_ISDIR(directory_stat.st_mode):
             msg = f"Dumping path {directory} is not directory."
             raise OSError(msg)
 
+        suffix = ("_".join(str(p) for p in self.coordinates.values())).replace(" ", "_")
         for namelist in self.namelists:
-            suffix = ("_".join([str(p) for p in self.coordinates.values()])).replace(" ", "_")
-            filename = namelist.name + "_" + suffix
-            namelist.dump(directory / filename)
+            namelist.dump(directory / f"{namelist.name}_{suffix}")
 
     @classmethod
     def build_from_config(cls: type[Self], config: models.ConfigTask, config_rootdir: Path, **kwargs: Any) -> Self:
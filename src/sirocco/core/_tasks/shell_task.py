@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import stat
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Self
 
@@ -34,12 +35,17 @@ class ShellTask(models.ConfigShellTaskSpecs, Task):
     @staticmethod
     def _validate_src(config_src: Path, config_rootdir: Path) -> Path:
         if config_src.is_absolute():
-            msg = f"Namelist path {config_src} must be relative with respect to config file."
+            msg = f"Script path {config_src} must be relative with respect to config file."
+            raise ValueError(msg)
         src = config_rootdir / config_src
-        if not src.exists():
+        # a single stat call replaces the separate exists() and is_file() checks, like exists()
+        # any path that cannot be reached (ENOTDIR, ELOOP, ...) is reported as missing
+        try:
+            src_stat = src.stat()
+        except OSError as err:
             msg = f"Script in path {src} does not exist."
-            raise FileNotFoundError(msg)
-        if not src.is_file():
+            raise FileNotFoundError(msg) from err
+        if not stat.S_ISREG(src_stat.st_mode):
             msg = f"Script in path {src} is not a file."
             raise OSError(msg)
         return src
@@ -3,6 +3,7 @@ from __future__ import annotations
 import enum
 from dataclasses import dataclass, field
 from itertools import chain, product
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any, ClassVar, Self, TypeVar, cast
 
 from sirocco.parsing.target_cycle import DateList, LagList, NoTargetCycle
@@ -13,7 +14,7 @@ from sirocco.parsing.yaml_data_models import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterable, Iterator, Sequence
     from pathlib import Path
 
     from sirocco.parsing.cycling import CyclePoint
@@ -71,6 +72,10 @@ class GeneratedData(Data):
     pass
 
 
+# Plugin class resolved for each config type, filled lazily by Task.from_config
+_PLUGIN_FOR_CONFIG_TYPE: dict[type, type[Task]] = {}
+
+
 @dataclass(kw_only=True)
 class Task(ConfigBaseTaskSpecs, GraphItem):
     """Internal representation of a task node"""
@@ -84,7 +89,8 @@ class Task(ConfigBaseTaskSpecs, GraphItem):
     config_rootdir: Path
     cycle_point: CyclePoint
 
-    _wait_on_specs: list[ConfigCycleTaskWaitOn] = field(default_factory=list, repr=False)
+    # always replaced in from_config, an empty tuple avoids allocating a list per task beforehand
+    _wait_on_specs: Sequence[ConfigCycleTaskWaitOn] = field(default=(), repr=False)
 
     def __post_init__(self):
         pass
@@ -97,13 +103,13 @@ class Task(ConfigBaseTaskSpecs, GraphItem):
         Task.plugin_classes[cls.plugin] = cls
 
     def input_data_nodes(self) -> Iterator[Data]:
-        yield from chain(*self.inputs.values())
+        return chain.from_iterable(self.inputs.values())
 
     def input_data_items(self) -> Iterator[tuple[str, Data]]:
         yield from ((key, value) for key, values in self.inputs.items() for value in values)
 
     def output_data_nodes(self) -> Iterator[Data]:
-        yield from chain(*self.outputs.values())
+        return chain.from_iterable(self.outputs.values())
 
     def output_data_items(self) -> Iterator[tuple[str | None, Data]]:
         yield from ((key, value) for key, values in self.outputs.items() for value in values)
@@ -130,9 +136,11 @@ class Task(ConfigBaseTaskSpecs, GraphItem):
                 outputs[output_spec.port] = []
             outputs[output_spec.port].append(datastore[output_spec.name, coordinates])
 
-        if (plugin_cls := Task.plugin_classes.get(type(config).plugin, None)) is None:
-            msg = f"Plugin {type(config).plugin!r} is not supported."
-            raise ValueError(msg)
+        if (plugin_cls := _PLUGIN_FOR_CONFIG_TYPE.get(config_type := type(config))) is None:
+            if (plugin_cls := Task.plugin_classes.get(config_type.plugin, None)) is None:
+                msg = f"Plugin {config_type.plugin!r} is not supported."
+                raise ValueError(msg)
+            _PLUGIN_FOR_CONFIG_TYPE[config_type] = plugin_cls
 
         new = plugin_cls.build_from_config(
             config,
@@ -158,11 +166,8 @@ class Task(ConfigBaseTaskSpecs, GraphItem):
 
     def link_wait_on_tasks(self, taskstore: Store[Task]) -> None:
         self.wait_on = list(
-            chain(
-                *(
-                    taskstore.iter_from_cycle_spec(wait_on_spec, self.coordinates)
-                    for wait_on_spec in self._wait_on_specs
-                )
+            chain.from_iterable(
+                taskstore.iter_from_cycle_spec(wait_on_spec, self.coordinates) for wait_on_spec in self._wait_on_specs
             )
         )
 
@@ -182,40 +187,71 @@ class Array[GRAPH_ITEM_T]:
     def __init__(self, name: str) -> None:
         self._name = name
         self._dims: tuple[str, ...] = ()
+        self._dims_set: frozenset[str] = frozenset()
         self._axes: dict[str, set] = {}
         self._dict: dict[tuple, GRAPH_ITEM_T] = {}
+        self._key: Callable[[dict], tuple] = self._key_getter(self._dims)
+
+    @staticmethod
+    def _key_getter(dims: tuple[str, ...]) -> Callable[[dict], tuple]:
+        # itemgetter returns a bare value for a single item and needs at least one
+        if len(dims) == 1:
+            (dim,) = dims
+            return lambda coordinates: (coordinates[dim],)
+        if dims:
+            return itemgetter(*dims)
+        return lambda _: ()
 
     def __setitem__(self, coordinates: dict, value: GRAPH_ITEM_T) -> None:
         # First access: set axes and initialize dictionnary
         input_dims = tuple(coordinates.keys())
         if self._dims == ():
             self._dims = input_dims
+            self._dims_set = frozenset(input_dims)
             self._axes = {k: set() for k in self._dims}
             self._dict = {}
+            self._key = self._key_getter(self._dims)
         # check dimensions
         elif self._dims != input_dims:
             msg = f"Array {self._name}: coordinate names {input_dims} don't match Array dimensions {self._dims}"
             raise KeyError(msg)
         # Build internal key
         # use the order of self._dims instead of param_keys to ensure reproducibility
-        key = tuple(coordinates[dim] for dim in self._dims)
+        self._insert(self._key(coordinates), value)
+
+    def extend(self, items: Iterable[tuple[dict, GRAPH_ITEM_T]]) -> None:
+        """Set several (coordinates, value) pairs, checking the dimensions in full only for the first one"""
+        pairs = iter(items)
+        if (first := next(pairs, None)) is None:
+            return
+        self.__setitem__(*first)
+        for coordinates, value in pairs:
+            # the first item fixed or checked the dimensions, the others only need the cheap set comparison
+            if coordinates.keys() != self._dims_set:
+                input_dims = tuple(coordinates)
+                msg = f"Array {self._name}: coordinate names {input_dims} don't match Array dimensions {self._dims}"
+                raise KeyError(msg)
+            self._insert(self._key(coordinates), value)
+
+    def _insert(self, key: tuple, value: GRAPH_ITEM_T) -> None:
         # Check if slot already taken
         if key in self._dict:
             msg = f"Array {self._name}: key {key} already used, cannot set item twice"
             raise KeyError(msg)
         # Store new axes values
-        for dim in self._dims:
-            self._axes[dim].add(coordinates[dim])
+        for dim, axis_value in zip(self._dims, key, strict=True):
+            self._axes[dim].add(axis_value)
         # Set item
         self._dict[key] = value
 
     def __getitem__(self, coordinates: dict) -> GRAPH_ITEM_T:
-        if self._dims != (input_dims := tuple(coordinates.keys())):
+        # comparing the keys view to a set is cheap and also rejects extra keys the key getter would ignore
+        if coordinates.keys() != self._dims_set:
+            input_dims = tuple(coordinates)
             msg = f"Array {self._name}: coordinate names {input_dims} don't match Array dimensions {self._dims}"
             raise KeyError(msg)
         # use the order of self._dims instead of param_keys to ensure reproducibility
-        key = tuple(coordinates[dim] for dim in self._dims)
-        return self._dict[key]
+        return self._dict[self._key(coordinates)]
 
     def iter_from_cycle_spec(self, spec: TargetNodesBaseModel, ref_coordinates: dict) -> Iterator[GRAPH_ITEM_T]:
         # Check date references
@@ -226,23 +262,37 @@ class Array[GRAPH_ITEM_T]:
             msg = f"Array {self._name} has a date dimension, must be referenced by dates"
             raise ValueError(msg)
 
-        for key in product(*(self._resolve_target_dim(spec, dim, ref_coordinates) for dim in self._dims)):
+        # Fast path: every dimension is fixed by the reference coordinates, the key is
+        # built directly instead of going through a product of single values
+        if (resolvers := self._target_dim_resolvers(spec)) is None:
+            yield self._dict[self._key(ref_coordinates)]
+            return
+
+        for key in product(*(resolver(ref_coordinates) for resolver in resolvers)):
             yield self._dict[key]
 
-    def _resolve_target_dim(self, spec: TargetNodesBaseModel, dim: str, ref_coordinates: Any) -> Iterator[Any]:
+    def _target_dim_resolvers(self, spec: TargetNodesBaseModel) -> list[Callable[[dict], Iterable]] | None:
+        """Resolvers of the target values of each dimension, None if they are all fixed by the reference"""
+        if all(
+            isinstance(spec.target_cycle, NoTargetCycle) if dim == "date" else spec.parameters.get(dim) == "single"
+            for dim in self._dims
+        ):
+            return None
+        return [self._target_dim_resolver(spec, dim) for dim in self._dims]
+
+    def _target_dim_resolver(self, spec: TargetNodesBaseModel, dim: str) -> Callable[[dict], Iterable]:
         if dim == "date":
-            match spec.target_cycle:
+            match target_cycle := spec.target_cycle:
                 case NoTargetCycle():
-                    yield ref_coordinates["date"]
+                    return lambda ref_coordinates: (ref_coordinates["date"],)
                 case DateList():
-                    yield from spec.target_cycle.dates
+                    return lambda _: target_cycle.dates
                 case LagList():
-                    for lag in spec.target_cycle.lags:
-                        yield ref_coordinates["date"] + lag
-        elif spec.parameters.get(dim) == "single":
-            yield ref_coordinates[dim]
-        else:
-            yield from self._axes[dim]
+                    return lambda ref_coordinates: [ref_coordinates["date"] + lag for lag in target_cycle.lags]
+            return lambda _: ()
+        if spec.parameters.get(dim) == "single":
+            return lambda ref_coordinates: (ref_coordinates[dim],)
+        return lambda _: self._axes[dim]
 
     def __iter__(self) -> Iterator[GRAPH_ITEM_T]:
         yield from self._dict.values()
@@ -261,6 +311,25 @@ class Store[GRAPH_ITEM_T]:
             self._dict[name] = Array[GRAPH_ITEM_T](name)
         self._dict[name][coordinates] = item
 
+    def extend(self, name: str, items: Iterable[GRAPH_ITEM_T]) -> None:
+        """Add several items sharing the same name, looking up their Array and checking its dimensions once"""
+
+        def coordinates_items() -> Iterator[tuple[dict, GRAPH_ITEM_T]]:
+            for item in items:
+                graph_item = cast(GraphItem, item)
+                if graph_item.name != name:
+                    msg = f"cannot add item {graph_item.name} to entry {name} of Store"
+                    raise KeyError(msg)
+                yield graph_item.coordinates, item
+
+        pairs = coordinates_items()
+        # like add, only register the entry once it has an item
+        if (first := next(pairs, None)) is None:
+            return
+        if (array := self._dict.get(name)) is None:
+            array = self._dict[name] = Array[GRAPH_ITEM_T](name)
+        array.extend(chain((first,), pairs))
+
     def __getitem__(self, key: tuple[str, dict]) -> GRAPH_ITEM_T:
         name, coordinates = key
         if name not in self._dict:
@@ -269,7 +338,7 @@ class Store[GRAPH_ITEM_T]:
         return self._dict[name][coordinates]
 
     def iter_from_cycle_spec(self, spec: TargetNodesBaseModel, ref_coordinates: dict) -> Iterator[GRAPH_ITEM_T]:
-        if spec.when.is_active(ref_coordinates.get("date")):
+        if (when := spec.when).is_always_active or when.is_active(ref_coordinates.get("date")):
             yield from self._dict[spec.name].iter_from_cycle_spec(spec, ref_coordinates)
 
     def __iter__(self) -> Iterator[GRAPH_ITEM_T]:
@@ -1,4 +1,7 @@
-import re
+import functools
+import io
+import pickle
+import stat
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Self
@@ -8,6 +11,15 @@ import f90nml
 from sirocco.parsing import yaml_data_models as models
 
 
+@functools.lru_cache(maxsize=128)
+def _read_namelist(path: Path, mtime_ns: int) -> bytes:  # noqa: ARG001 mtime_ns is only part of the cache key
+    """Parse a namelist file, cached by path and modification time.
+
+    The parsed namelist is kept pickled, unpickling it gives each caller its own copy and is
+    much cheaper than a deepcopy of the nested f90nml.Namelist objects."""
+    return pickle.dumps(f90nml.read(path), protocol=pickle.HIGHEST_PROTOCOL)
+
+
 @dataclass(kw_only=True)
 class NamelistFile(models.ConfigNamelistFileSpec):
     """A wrapper Class around f90nml.namelist.Namelist
@@ -19,13 +31,17 @@ class NamelistFile(models.ConfigNamelistFileSpec):
 
     def __post_init__(self) -> None:
         self.name = self.path.name
-        self._namelist = f90nml.read(self.path)
+        # Tasks of each cycle point and parameter read the same files, copying the cached parse is cheaper than
+        # parsing again. The copy is needed as the namelist is updated per task.
+        pickled = _read_namelist(self.path, self.path.stat().st_mtime_ns)
+        self._namelist = pickle.loads(pickled)  # noqa: S301 produced by _read_namelist
 
     @classmethod
     def from_config(cls: type[Self], config: models.ConfigNamelistFile, config_rootdir: Path) -> Self:
         path = cls._validate_namelist_path(config.path, config_rootdir)
         self = cls(path=path)
-        self.update_from_specs(config.specs)
+        if config.specs:
+            self.update_from_specs(config.specs)
         return self
 
     @property
@@ -55,23 +71,32 @@ class NamelistFile(models.ConfigNamelistFileSpec):
         if path.is_dir():
             msg = f"Cannot write namelist {path.name} to path {path.name} already exists."
             raise OSError(msg)
-        self.namelist.write(path)
+        # Render in memory and write the file in one go instead of letting f90nml write it line by line
+        with io.StringIO() as buffer:
+            self.namelist.write(buffer)
+            path.write_text(buffer.getvalue())
 
     @staticmethod
     def _validate_namelist_path(config_namelist_path: Path, config_rootdir: Path) -> Path:
         if config_namelist_path.is_absolute():
             msg = f"Namelist path {config_namelist_path} must be relative with respect to config file."
-        namelist_path = config_namelist_path if config_rootdir is None else (config_rootdir / config_namelist_path)
-        if not namelist_path.exists():
+            raise ValueError(msg)
+        namelist_path = config_rootdir / config_namelist_path
+        # a single stat call replaces the separate exists() and is_file() checks, like exists()
+        # any path that cannot be reached (ENOTDIR, ELOOP, ...) is reported as missing
+        try:
+            namelist_stat = namelist_path.stat()
+        except OSError as err:
             msg = f"Namelist in path {namelist_path} does not exist."
-            raise FileNotFoundError(msg)
-        if not namelist_path.is_file():
+            raise FileNotFoundError(msg) from err
+        if not stat.S_ISREG(namelist_stat.st_mode):
             msg = f"Namelist in path {namelist_path} is not a file."
             raise OSError(msg)
         return namelist_path
 
     @staticmethod
-    def section_index(section_name) -> tuple[str, int | None]:
+    @functools.lru_cache(maxsize=1024)
+    def section_index(section_name: str) -> tuple[str, int | None]:
         """Check for single vs multiple namelist section
 
         Check if the user specified a section name that ends with digits
@@ -83,7 +108,9 @@ class NamelistFile(models.ConfigNamelistFileSpec):
         This is the convention chosen to indicate multiple
         sections with the same name, typically `output_nml` for multiple
         output streams."""
-        multi_section_pattern = re.compile(r"(.*)\[([0-9]+)\]$")
-        if m := multi_section_pattern.match(section_name):
-            return m.group(1), int(m.group(2)) - 1
+        # Plain string operations instead of a regex: most section names do not end with a bracket
+        if section_name.endswith("]"):
+            name, bracket, index = section_name[:-1].rpartition("[")
+            if bracket and index.isascii() and index.isdigit():
+                return name, int(index) - 1
         return section_name, None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from itertools import chain, product
 from typing import TYPE_CHECKING, Self
 
@@ -47,30 +48,58 @@ class Workflow:
         config_task_dict: dict[str, ConfigTask] = {task.name: task for task in config_tasks}
 
         # Function to iterate over date and parameter combinations
+        # The same parameter references recur for many tasks and data of a cycle point, so the
+        # coordinates are only generated once per (param_refs, date) and shared between nodes
+        coordinates_cache: dict[tuple, list[dict]] = {}
+
         def iter_coordinates(cycle_point: CyclePoint, param_refs: list[str]) -> Iterator[dict]:
-            axes = {k: parameters[k] for k in param_refs}
-            if isinstance(cycle_point, DateCyclePoint):
-                axes["date"] = [cycle_point.chunk_start_date]
-            yield from (dict(zip(axes.keys(), x, strict=False)) for x in product(*axes.values()))
+            date = cycle_point.chunk_start_date if isinstance(cycle_point, DateCyclePoint) else None
+            cache_key = (tuple(param_refs), date)
+            if (coordinates_list := coordinates_cache.get(cache_key)) is None:
+                axes = {k: parameters[k] for k in param_refs}
+                if date is not None:
+                    axes["date"] = [date]
+                # parameter names are read from the different yaml entries, intern them so that
+                # coordinates lookups compare keys by identity
+                keys = tuple(sys.intern(k) for k in axes)
+                coordinates_list = [dict(zip(keys, x, strict=True)) for x in product(*axes.values())]
+                coordinates_cache[cache_key] = coordinates_list
+            yield from coordinates_list
+
+        # Cycle points are needed for both the data and the task nodes, generate them only once per cycle
+        cycles_points: list[tuple[ConfigCycle, list[CyclePoint]]] = [
+            (cycle_config, list(cycle_config.cycling.iter_cycle_points())) for cycle_config in config_cycles
+        ]
 
         # 1 - create availalbe data nodes
         for available_data_config in config_data.available:
-            for coordinates in iter_coordinates(OneOffPoint(), available_data_config.parameters):
-                self.data.add(Data.from_config(config=available_data_config, coordinates=coordinates))
+            self.data.extend(
+                available_data_config.name,
+                (
+                    Data.from_config(config=available_data_config, coordinates=coordinates)
+                    for coordinates in iter_coordinates(OneOffPoint(), available_data_config.parameters)
+                ),
+            )
 
         # 2 - create output data nodes
-        for cycle_config in config_cycles:
-            for cycle_point in cycle_config.cycling.iter_cycle_points():
+        # collect the nodes of each data name over all cycle points to add them to the store in one batch
+        generated_data: dict[str, list[Data]] = {}
+        for cycle_config, cycle_points in cycles_points:
+            for cycle_point in cycle_points:
                 for task_ref in cycle_config.tasks:
                     for data_ref in task_ref.outputs:
                         data_config = config_data_dict[data_ref.name]
-                        for coordinates in iter_coordinates(cycle_point, data_config.parameters):
-                            self.data.add(Data.from_config(config=data_config, coordinates=coordinates))
+                        generated_data.setdefault(data_config.name, []).extend(
+                            Data.from_config(config=data_config, coordinates=coordinates)
+                            for coordinates in iter_coordinates(cycle_point, data_config.parameters)
+                        )
+        for data_name, data_nodes in generated_data.items():
+            self.data.extend(data_name, data_nodes)
 
         # 3 - create cycles and tasks
-        for cycle_config in config_cycles:
+        for cycle_config, cycle_points in cycles_points:
             cycle_name = cycle_config.name
-            for cycle_point in cycle_config.cycling.iter_cycle_points():
+            for cycle_point in cycle_points:
                 cycle_tasks = []
                 for task_graph_spec in cycle_config.tasks:
                     task_name = task_graph_spec.name
@@ -1,67 +1,89 @@
-from collections.abc import Iterator
+import functools
+from collections.abc import Callable, Iterator
 from datetime import datetime
+from operator import attrgetter
 from typing import Any
 
 from isoduration import parse_duration
 from isoduration.types import Duration
 
+_duration_components = attrgetter(
+    "date.years", "date.months", "date.days", "time.hours", "time.minutes", "time.seconds"
+)
+
+
+def duration_is_less_equal_zero(duration: Duration) -> bool:
+    components = _duration_components(duration)
+    return min(components) < 0 or not any(components)
+
+
+def walltime_to_seconds(walltime_str: str) -> int:
+    """Convert HH:MM:SS format to seconds.
+    Args:
+        walltime_str: Time string in HH:MM:SS format (e.g., "00:05:00")
+    Returns:
+        Total seconds as integer
+    Raises:
+        ValueError: If the time format is invalid
+    """
+    # Same fields and ranges as strptime with "%H:%M:%S" without building a datetime
+    parts = walltime_str.split(":")
+    if len(parts) == 3 and all(len(p) in (1, 2) and p.isascii() and p.isdigit() for p in parts):  # noqa: PLR2004
+        hours, minutes, seconds = map(int, parts)
+        if hours < 24 and minutes < 60 and seconds < 60:  # noqa: PLR2004
+            return hours * 3600 + minutes * 60 + seconds
+    msg = f"Invalid time format '{walltime_str}'. Expected HH:MM:SS format."
+    raise ValueError(msg)
+
 
 class TimeUtils:
-    @staticmethod
-    def duration_is_less_equal_zero(duration: Duration) -> bool:
-        if (
-            duration.date.years == 0
-            and duration.date.months == 0
-            and duration.date.days == 0
-            and duration.time.hours == 0
-            and duration.time.minutes == 0
-            and duration.time.seconds == 0
-            or (
-                duration.date.years < 0
-                or duration.date.months < 0
-                or duration.date.days < 0
-                or duration.time.hours < 0
-                or duration.time.minutes < 0
-                or duration.time.seconds < 0
-            )
-        ):
-            return True
-        return False
-
-    @staticmethod
-    def walltime_to_seconds(walltime_str: str) -> int:
-        """Convert HH:MM:SS format to seconds.
-        Args:
-            walltime_str: Time string in HH:MM:SS format (e.g., "00:05:00")
-        Returns:
-            Total seconds as integer
-        Raises:
-            ValueError: If the time format is invalid
-        """
-        try:
-            time_obj = datetime.strptime(walltime_str, "%H:%M:%S")  # noqa: DTZ007
-            return time_obj.hour * 3600 + time_obj.minute * 60 + time_obj.second
-        except ValueError as e:
-            msg = f"Invalid time format '{walltime_str}'. Expected HH:MM:SS format."
-            raise ValueError(msg) from e
+    # kept for backward compatibility, use the module level functions
+    duration_is_less_equal_zero = staticmethod(duration_is_less_equal_zero)
+    walltime_to_seconds = staticmethod(walltime_to_seconds)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_duration(value: str) -> Duration:
+    # the same few duration strings are repeated all over a config, the parsed durations are
+    # shared and never modified
+    return parse_duration(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date(value: str) -> datetime:
+    # start and stop dates are repeated by many cycles and when conditions
+    return datetime.fromisoformat(value)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# converters for the exact types of values coming from yaml, the match statements handle subclasses
+_DATE_CONVERTERS: dict[type, Callable[[Any], datetime]] = {datetime: _identity, str: _parse_date}
+_DURATION_CONVERTERS: dict[type, Callable[[Any], Duration]] = {Duration: _identity, str: _parse_duration}
 
 
 def convert_to_date(value: Any) -> datetime:
+    if (converter := _DATE_CONVERTERS.get(type(value))) is not None:
+        return converter(value)
     match value:
         case datetime():
             return value
         case str():
-            return datetime.fromisoformat(value)
+            return _parse_date(value)
         case _:
             raise TypeError
 
 
 def convert_to_duration(value: Any) -> Duration:
+    if (converter := _DURATION_CONVERTERS.get(type(value))) is not None:
+        return converter(value)
     match value:
         case Duration():
             return value
         case str():
-            return parse_duration(value)
+            return _parse_duration(value)
         case _:
             raise TypeError
 
@@ -78,8 +100,12 @@ def iter_yaml_item(values: Any) -> Iterator[Any]:
 
 
 def convert_to_date_list(values: Any) -> list[datetime]:
-    return [convert_to_date(item) for item in iter_yaml_item(values)]
+    if isinstance(values, list):
+        return [convert_to_date(item) for item in values]
+    return [convert_to_date(values)]
 
 
 def convert_to_duration_list(values: Any) -> list[Duration]:
-    return [convert_to_duration(item) for item in iter_yaml_item(values)]
+    if isinstance(values, list):
+        return [convert_to_duration(item) for item in values]
+    return [convert_to_duration(values)]
@@ -2,26 +2,33 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Iterator  # noqa: TCH003 needed for pydantic
-from dataclasses import dataclass
-from datetime import datetime  # noqa: TCH003 needed for pydantic
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from typing import Annotated, Self
 
 from isoduration.types import Duration  # noqa: TCH002 needed for pydantic
 from pydantic import BaseModel, BeforeValidator, ConfigDict, model_validator
 
-from sirocco.parsing._utils import TimeUtils, convert_to_date, convert_to_duration
+from sirocco.parsing._utils import convert_to_date, convert_to_duration, duration_is_less_equal_zero
 
 
 class CyclePoint:
-    pass
+    # A point is created per chunk of each cycle, no instance dict needed
+    __slots__ = ()
 
 
 class OneOffPoint(CyclePoint):
+    __slots__ = ()
+
     def __str__(self) -> str:
         return "[]"
 
 
-@dataclass(kw_only=True)
+# OneOffPoint is stateless, all one-off cycles share the same point
+_ONE_OFF_POINT = OneOffPoint()
+
+
+@dataclass(kw_only=True, slots=True)
 class DateCyclePoint(CyclePoint):
     """
     Dates of the current point in the cycle
@@ -36,8 +43,13 @@ class DateCyclePoint(CyclePoint):
     chunk_stop_date: datetime
     period: Duration
 
+    _str: str | None = field(default=None, init=False, repr=False, compare=False)
+
     def __str__(self) -> str:
-        return f"[{self.chunk_start_date} -- {self.chunk_stop_date}]"
+        # points are printed repeatedly when rendering a workflow, format them only once
+        if self._str is None:
+            self._str = f"[{self.chunk_start_date} -- {self.chunk_stop_date}]"
+        return self._str
 
 
 class Cycling(ABC):
@@ -48,7 +60,7 @@ class Cycling(ABC):
 
 class OneOff(Cycling):
     def iter_cycle_points(self) -> Iterator[OneOffPoint]:
-        yield OneOffPoint()
+        yield _ONE_OFF_POINT
 
 
 class DateCycling(BaseModel, Cycling):
@@ -62,23 +74,39 @@ class DateCycling(BaseModel, Cycling):
         if self.start_date > self.stop_date:
             msg = f"start_date {self.start_date!r} lies after given stop_date {self.stop_date!r}."
             raise ValueError(msg)
-        if TimeUtils.duration_is_less_equal_zero(self.period):
+        if duration_is_less_equal_zero(self.period):
             msg = f"period {self.period!r} is negative or zero."
             raise ValueError(msg)
-        if self.start_date + self.period > self.stop_date:
+        if self.start_date + (self._fixed_period() or self.period) > self.stop_date:
             msg = f"period {self.period!r} larger than the duration between start date {self.start_date!r} and stop_date {self.stop_date!r}"
             raise ValueError(msg)
         return self
 
+    def _fixed_period(self) -> timedelta | None:
+        """The period as timedelta if it has a fixed length, None otherwise
+
+        Periods in years or months depend on the calendar and fractional values are rounded by
+        isoduration, only whole weeks, days, hours, minutes and seconds give the same dates as the
+        Duration arithmetic."""
+        date, time = self.period.date, self.period.time
+        components = (date.weeks, date.days, time.hours, time.minutes, time.seconds)
+        if date.years or date.months or self.start_date.microsecond or any(c % 1 for c in components):
+            return None
+        weeks, days, hours, minutes, seconds = map(int, components)
+        return timedelta(weeks=weeks, days=days, hours=hours, minutes=minutes, seconds=seconds)
+
     def iter_cycle_points(self) -> Iterator[DateCyclePoint]:
-        begin = self.start_date
-        while begin < self.stop_date:
-            end = min(begin + self.period, self.stop_date)
+        # timedelta arithmetic is much cheaper than the calendar handling of Duration
+        step: Duration | timedelta = self._fixed_period() or self.period
+        start_date, stop_date, period = self.start_date, self.stop_date, self.period
+        begin = start_date
+        while begin < stop_date:
+            end = min(begin + step, stop_date)
             yield DateCyclePoint(
-                start_date=self.start_date,
-                stop_date=self.stop_date,
+                start_date=start_date,
+                stop_date=stop_date,
                 chunk_start_date=begin,
                 chunk_stop_date=end,
-                period=self.period,
+                period=period,
             )
             begin = end
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, ClassVar
 
 from pydantic import BaseModel, BeforeValidator
 
@@ -8,12 +8,21 @@ from sirocco.parsing._utils import convert_to_date, convert_to_date_or_none
 
 
 class When(ABC):
+    __slots__ = ()
+
+    # lets callers skip the is_active call for conditions that always hold
+    is_always_active: ClassVar[bool] = False
+
     @abstractmethod
     def is_active(self, date: datetime | None) -> bool:
         raise NotImplementedError
 
 
 class AnyWhen(When):
+    __slots__ = ()
+
+    is_always_active: ClassVar[bool] = True
+
     def is_active(self, date: datetime | None) -> bool:  # noqa: ARG002  # dummy argument needed
         return True
 
@@ -2,10 +2,8 @@ from __future__ import annotations
 
 import itertools
 import re
-import time
 import typing
 from dataclasses import dataclass, field
-from io import StringIO
 from pathlib import Path
 from typing import Annotated, Any, ClassVar, Literal, Self
 
@@ -22,12 +20,16 @@ from pydantic import (
 )
 from ruamel.yaml import YAML
 
+from sirocco.parsing._utils import walltime_to_seconds
 from sirocco.parsing.cycling import Cycling, DateCycling, OneOff
 from sirocco.parsing.target_cycle import DateList, LagList, NoTargetCycle, TargetCycle
 from sirocco.parsing.when import AnyWhen, AtDate, BeforeAfterDate, When
 
 ITEM_T = typing.TypeVar("ITEM_T")
 
+# Shared safe reader, without pure=True ruamel uses its C based loader when ruamel.yaml.clib is installed
+_YAML_READER = YAML(typ="safe")
+
 
 def list_not_empty(value: list[ITEM_T]) -> list[ITEM_T]:
     if len(value) < 1:
@@ -37,26 +39,22 @@ def list_not_empty(value: list[ITEM_T]) -> list[ITEM_T]:
 
 
 def extract_merge_key_as_value(data: Any, new_key: str = "name") -> Any:
-    if not isinstance(data, dict):
+    # called for every named entry of the config, hence plain checks ordered by frequency
+    if not isinstance(data, dict) or len(data) != 1:
         return data
-    if len(data) == 1:
-        key, value = next(iter(data.items()))
-        match key:
-            case str():
-                match value:
-                    case str() if key == new_key:
-                        pass
-                    case dict() if new_key not in value:
-                        data = value | {new_key: key}
-                    case None:
-                        data = {new_key: key}
-                    case _:
-                        msg = f"Expected a mapping, not a value (got {data})."
-                        raise TypeError(msg)
-            case _:
-                msg = f"{new_key} must be a string (got {key})."
-                raise TypeError(msg)
-    return data
+    key, value = next(iter(data.items()))
+    if not isinstance(key, str):
+        msg = f"{new_key} must be a string (got {key})."
+        raise TypeError(msg)
+    if isinstance(value, dict):
+        if new_key not in value:
+            return value | {new_key: key}
+    elif value is None:
+        return {new_key: key}
+    elif isinstance(value, str) and key == new_key:
+        return data
+    msg = f"Expected a mapping, not a value (got {data})."
+    raise TypeError(msg)
 
 
 class _NamedBaseModel(BaseModel):
@@ -114,8 +112,8 @@ def select_when(spec: Any) -> When:
                 if any(k in spec for k in ("before", "after")):
                     msg = "'at' key is incompatible with 'before' and after'"
                     raise KeyError(msg)
-                return AtDate(**spec)
-            return BeforeAfterDate(**spec)
+                return AtDate.model_validate(spec)
+            return BeforeAfterDate.model_validate(spec)
         case _:
             raise TypeError
 
@@ -191,7 +189,7 @@ def make_named_model_list_converter(
                 case str():
                     inputs.append(cls(name=value))
                 case dict():
-                    inputs.append(cls(**value))
+                    inputs.append(cls.model_validate(value))
                 case _NamedBaseModel():
                     inputs.append(value)
                 case _:
@@ -225,7 +223,7 @@ def select_cycling(spec: Any) -> Cycling:
             if spec.keys() != {"start_date", "stop_date", "period"}:
                 msg = "cycling requires the 'start_date' 'stop_date' and 'period' keys and only these"
                 raise KeyError(msg)
-            return DateCycling(**spec)
+            return DateCycling.model_validate(spec)
         case _:
             raise TypeError
 
@@ -277,9 +275,9 @@ class ConfigBaseTask(_NamedBaseModel, ConfigBaseTaskSpecs):
             return None
 
         try:
-            # This will raise ValueError if format is invalid
-            time.strptime(value, "%H:%M:%S")
-            # Return the original string, not the parsed time object
+            # This will raise ValueError if format is invalid, same rules as time.strptime without its overhead
+            walltime_to_seconds(value)
+            # Return the original string, not the parsed seconds
             return value  # noqa: TRY300
         except ValueError as e:
             msg = f"walltime must be in HH:MM:SS format, got '{value}'"
@@ -506,8 +504,7 @@ class ConfigIconTask(ConfigBaseTask, ConfigIconTaskSpecs):
     @classmethod
     def check_nmls(cls, nmls: list[ConfigNamelistFile]) -> list[ConfigNamelistFile]:
         # Make validator idempotent even if not used yet
-        names = [nml.path.name for nml in nmls]
-        if "icon_master.namelist" not in names:
+        if not any(nml.path.name == "icon_master.namelist" for nml in nmls):
             msg = "icon_master.namelist not found"
             raise ValueError(msg)
         return nmls
@@ -624,12 +621,9 @@ def check_parameters_lists(data: Any) -> dict[str, list]:
     if not isinstance(data, dict):
         raise TypeError
     for param_name, param_values in data.items():
-        msg = f"""{param_name}: parameters must map a string to list of single values, got {param_values}"""
-        if isinstance(param_values, list):
-            for v in param_values:
-                if isinstance(v, dict | list):
-                    raise TypeError(msg)
-        else:
+        if not isinstance(param_values, list) or any(isinstance(v, dict | list) for v in param_values):
+            # only format the message on error, param_values can be long
+            msg = f"""{param_name}: parameters must map a string to list of single values, got {param_values}"""
             raise TypeError(msg)
     return data
 
@@ -707,10 +701,14 @@ class ConfigWorkflow(BaseModel):
 
     @model_validator(mode="after")
     def check_parameters(self) -> ConfigWorkflow:
+        declared = self.parameters.keys()
         task_data_list = itertools.chain(self.tasks, self.data.generated, self.data.available)
         for item in task_data_list:
+            # set comparison for the common valid case, the loop only reports the first undeclared one
+            if declared >= set(item.parameters):
+                continue
             for param_name in item.parameters:
-                if param_name not in self.parameters:
+                if param_name not in declared:
                     msg = f"parameter {param_name} in {item.name} specification not declared in parameters section"
                     raise ValueError(msg)
         return self
@@ -735,24 +733,34 @@ class ConfigWorkflow(BaseModel):
             msg = f"Workflow config file in path {config_resolved_path} is not a file."
             raise FileNotFoundError(msg)
 
-        content = config_resolved_path.read_text()
         # An empty workflow is parsed to None object so we catch this here for a more understandable error
-        if content == "":
+        if config_resolved_path.stat().st_size == 0:
             msg = f"Workflow config file in path {config_resolved_path} is empty."
             raise ValueError(msg)
-        reader = YAML(typ="safe", pure=True)
-        object_ = reader.load(StringIO(content))
+        # the reader decodes the raw bytes itself, no need to read the content into a str first
+        with config_resolved_path.open("rb") as config_file:
+            object_ = _YAML_READER.load(config_file)
         # If name was not specified, then we use filename without file extension
         if "name" not in object_:
             object_["name"] = config_filename
         object_["rootdir"] = config_resolved_path.parent
-        adapter = TypeAdapter(cls)
+        adapter: TypeAdapter[Self] = _type_adapter(cls)
         return adapter.validate_python(object_)
 
 
 OBJECT_T = typing.TypeVar("OBJECT_T")
 
 
+# building the core schema of an adapter is expensive, do it once per class
+_TYPE_ADAPTERS: dict[type[Any], TypeAdapter[Any]] = {}
+
+
+def _type_adapter(cls: type[Any]) -> TypeAdapter[Any]:
+    if (adapter := _TYPE_ADAPTERS.get(cls)) is None:
+        adapter = _TYPE_ADAPTERS[cls] = TypeAdapter(cls)
+    return adapter
+
+
 def validate_yaml_content(cls: type[OBJECT_T], content: str) -> OBJECT_T:
     """Parses the YAML content into a python object using generic types and subsequently validates it with pydantic.
 
@@ -770,4 +778,5 @@ def validate_yaml_content(cls: type[OBJECT_T], content: str) -> OBJECT_T:
         against the specified class type.
         ruamel.yaml.YAMLError: If there is an error in parsing the YAML content.
     """
-    return TypeAdapter(cls).validate_python(YAML(typ="safe", pure=True).load(StringIO(content)))
+    adapter: TypeAdapter[OBJECT_T] = _type_adapter(cls)
+    return adapter.validate_python(_YAML_READER.load(content))
@@ -15,7 +15,7 @@ from aiida_icon.calculations import IconCalculation
 from aiida_shell.parsers.shell import ShellParser
 
 from sirocco import core
-from sirocco.parsing._utils import TimeUtils
+from sirocco.parsing._utils import walltime_to_seconds
 
 if TYPE_CHECKING:
     from aiida_workgraph.socket import TaskSocket  # type: ignore[import-untyped]
@@ -90,9 +90,7 @@ class AiidaWorkGraph:
         self._aiida_task_nodes: dict[str, aiida_workgraph.Task] = {}
 
         # create input data nodes
-        for data in self._core_workflow.data:
-            if isinstance(data, core.AvailableData):
-                self._add_aiida_input_data_node(data)
+        self._add_available_data()
 
         # create workgraph task nodes and output sockets
         for task in self._core_workflow.tasks:
@@ -180,28 +178,40 @@ class AiidaWorkGraph:
         return self._aiida_task_nodes[self.get_aiida_label_from_graph_item(core_task)]
 
     def _add_available_data(self):
-        """Adds the available data on initialization to the workgraph"""
+        """Adds the available data on initialization to the workgraph
+
+        Available data is grouped by computer so that each transport is opened only once and the connection is reused
+        for checking the existence of all data on that computer.
+        """
+        available_data: dict[str, list[core.AvailableData]] = {}
         for data in self._core_workflow.data:
             if isinstance(data, core.AvailableData):
-                self._add_aiida_input_data_node(data)
+                available_data.setdefault(data.computer, []).append(data)
 
-    def _add_aiida_input_data_node(self, data: core.AvailableData):
+        for computer_label, computer_data in available_data.items():
+            try:
+                computer = aiida.orm.load_computer(computer_label)
+            except NotExistent as err:
+                msg = f"Could not find computer {computer_label!r} for input {computer_data[0]}."
+                raise ValueError(msg) from err
+            with computer.get_transport() as transport:
+                for data in computer_data:
+                    self._add_aiida_input_data_node(data, computer, transport)
+
+    def _add_aiida_input_data_node(
+        self, data: core.AvailableData, computer: aiida.orm.Computer, transport: aiida.transports.Transport
+    ):
         """
         Create an `aiida.orm.Data` instance from the provided `data` that needs to exist on initialization of workflow.
+
+        The `transport` must be an open transport to `computer`.
         """
         label = self.get_aiida_label_from_graph_item(data)
 
-        try:
-            computer = aiida.orm.load_computer(data.computer)
-        except NotExistent as err:
-            msg = f"Could not find computer {data.computer!r} for input {data}."
-            raise ValueError(msg) from err
         # `remote_path` must be str not PosixPath to be JSON-serializable
-        transport = computer.get_transport()
-        with transport:
-            if not transport.path_exists(str(data.src)):
-                msg = f"Could not find available data {data.name} in path {data.src} on computer {data.computer}."
-                raise FileNotFoundError(msg)
+        if not transport.path_exists(str(data.src)):
+            msg = f"Could not find available data {data.name} in path {data.src} on computer {data.computer}."
+            raise FileNotFoundError(msg)
 
         if computer.get_transport_class() is aiida.transports.plugins.local.LocalTransport:
             if data.src.is_file():
@@ -333,8 +343,7 @@ class AiidaWorkGraph:
         builder.code = icon_code
         metadata = {}
 
-        task.update_icon_namelists_from_workflow()
-
+        # NOTE: the namelists were already updated from the workflow when the core task was built
         with io.StringIO() as buffer:
             task.master_namelist.namelist.write(buffer)
             buffer.seek(0)
@@ -359,7 +368,7 @@ class AiidaWorkGraph:
     def _from_task_get_scheduler_options(self, task: core.Task) -> dict[str, Any]:
         options: dict[str, Any] = {}
         if task.walltime is not None:
-            options["max_wallclock_seconds"] = TimeUtils.walltime_to_seconds(task.walltime)
+            options["max_wallclock_seconds"] = walltime_to_seconds(task.walltime)
         if task.mem is not None:
             options["max_memory_kb"] = task.mem * 1024
         if task.nodes is not None or task.ntasks_per_node is not None or task.cpus_per_task is not None:
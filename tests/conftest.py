@@ -26,12 +26,25 @@ class DownloadError(RuntimeError):
         super().__init__(f"Failed downloading file {url} , exited with response {response}")
 
 
-def download_file(url: str, file_path: pathlib.Path):
-    response = requests.get(url)
-    if not response.ok:
-        raise DownloadError(url, response)
+# Shared session so repeated downloads reuse the pooled connection
+_SESSION = requests.Session()
+
 
-    file_path.write_bytes(response.content)
+def download_file(url: str, file_path: pathlib.Path):
+    # Stream the response to disk in chunks to avoid holding large files (e.g. the icon grid) in memory
+    with _SESSION.get(url, stream=True, timeout=30) as response:
+        if not response.ok:
+            raise DownloadError(url, response)
+        response.raw.decode_content = True
+        # Write to a partial file first so an interrupted download never leaves a truncated cached file
+        part_path = file_path.with_name(file_path.name + ".part")
+        try:
+            with part_path.open("wb") as file:
+                shutil.copyfileobj(response.raw, file, length=1 << 20)
+            part_path.replace(file_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
 
 
 @pytest.fixture(scope="session")
@@ -0,0 +1,74 @@
+import pytest
+
+from sirocco.core.graph_items import Array, GeneratedData, Store
+
+
+def test_store_extend():
+    store: Store[GeneratedData] = Store()
+    items = [GeneratedData(name="data", coordinates={"member": member}) for member in range(3)]
+    store.extend("data", items)
+
+    for item in items:
+        assert store["data", item.coordinates] is item
+    assert list(store) == items
+
+
+def test_store_extend_name_mismatch():
+    store: Store[GeneratedData] = Store()
+    with pytest.raises(KeyError, match=r"cannot add item other to entry data of Store"):
+        store.extend("data", [GeneratedData(name="other", coordinates={})])
+    with pytest.raises(KeyError, match=r"entry data not found in Store"):
+        store["data", {}]
+
+
+def test_store_extend_empty():
+    store: Store[GeneratedData] = Store()
+    store.extend("data", [])
+
+    assert list(store) == []
+    with pytest.raises(KeyError, match=r"entry data not found in Store"):
+        store["data", {"member": 0}]
+
+
+@pytest.mark.parametrize(
+    "coordinates",
+    [
+        {"member": 0, "extra": 1},
+        {},
+        {"other": 0},
+    ],
+)
+def test_array_getitem_dimension_mismatch(coordinates):
+    array: Array[GeneratedData] = Array("data")
+    array[{"member": 0}] = GeneratedData(name="data", coordinates={"member": 0})
+    with pytest.raises(KeyError, match=r"coordinate names .* don't match Array dimensions \('member',\)"):
+        array[coordinates]
+
+
+def test_array_getitem_mutated_coordinates():
+    array: Array[GeneratedData] = Array("data")
+    item = GeneratedData(name="data", coordinates={"member": 0})
+    array[item.coordinates] = item
+
+    coordinates = {"member": 0}
+    assert array[coordinates] is item
+    coordinates["extra"] = 1
+    with pytest.raises(KeyError, match=r"don't match Array dimensions"):
+        array[coordinates]
+
+
+def test_store_extend_dimension_mismatch_in_batch():
+    store: Store[GeneratedData] = Store()
+    items = [
+        GeneratedData(name="data", coordinates={"member": 0}),
+        GeneratedData(name="data", coordinates={"member": 1, "extra": 0}),
+    ]
+    with pytest.raises(KeyError, match=r"coordinate names \('member', 'extra'\) don't match Array dimensions"):
+        store.extend("data", items)
+
+
+def test_store_extend_duplicate_coordinates():
+    store: Store[GeneratedData] = Store()
+    items = [GeneratedData(name="data", coordinates={"member": 0}) for _ in range(2)]
+    with pytest.raises(KeyError, match=r"key \(0,\) already used"):
+        store.extend("data", items)
@@ -0,0 +1,32 @@
+from pathlib import Path
+
+from sirocco.core._tasks.icon_task import IconTask
+from sirocco.core.namelistfile import NamelistFile
+from sirocco.parsing.cycling import OneOffPoint
+
+
+def test_first_namelist_wins_for_repeated_names(tmp_path):
+    for subdir in ("first", "second"):
+        (tmp_path / subdir).mkdir()
+        (tmp_path / subdir / "icon_master.namelist").write_text(
+            "&master_model_nml\n    model_namelist_filename = 'model.namelist'\n/\n"
+        )
+        (tmp_path / subdir / "model.namelist").write_text("&run_nml\n    nsteps = 1\n/\n")
+    namelists = [
+        NamelistFile(path=tmp_path / subdir / filename)
+        for filename in ("icon_master.namelist", "model.namelist")
+        for subdir in ("first", "second")
+    ]
+
+    task = IconTask(
+        name="icon",
+        coordinates={},
+        computer="localhost",
+        bin=Path("/bin/icon"),
+        config_rootdir=tmp_path,
+        cycle_point=OneOffPoint(),
+        namelists=namelists,
+    )
+
+    assert task.master_namelist is namelists[0]
+    assert task.model_namelist is namelists[2]
@@ -0,0 +1,81 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from sirocco.core.namelistfile import NamelistFile
+
+
+def write_namelist(path, content):
+    path.write_text(content)
+    # make sure the modification time differs from any previous write, coarse filesystem clocks could match
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_namelists_from_same_file_are_independent(tmp_path):
+    path = tmp_path / "test.nml"
+    write_namelist(path, "&run_nml\n    nsteps = 1\n/\n")
+
+    first = NamelistFile(path=path)
+    second = NamelistFile(path=path)
+    first.update_from_specs({"run_nml": {"nsteps": 2}, "new_nml": {"flag": True}})
+
+    assert first.namelist["run_nml"]["nsteps"] == 2
+    assert second.namelist["run_nml"]["nsteps"] == 1
+    assert "new_nml" not in second.namelist
+    assert NamelistFile(path=path).namelist["run_nml"]["nsteps"] == 1
+
+
+def test_namelist_rewritten_file_is_read_again(tmp_path):
+    path = tmp_path / "test.nml"
+    write_namelist(path, "&run_nml\n    nsteps = 1\n/\n")
+    assert NamelistFile(path=path).namelist["run_nml"]["nsteps"] == 1
+
+    write_namelist(path, "&run_nml\n    nsteps = 3\n/\n")
+    assert NamelistFile(path=path).namelist["run_nml"]["nsteps"] == 3
+
+
+def test_namelist_repeated_groups_indexed_update(tmp_path):
+    path = tmp_path / "test.nml"
+    write_namelist(
+        path,
+        "&output_nml\n    output_filename = 'first'\n/\n"
+        "&output_nml\n    output_filename = 'second'\n/\n"
+        "&output_nml\n    output_filename = 'third'\n/\n",
+    )
+
+    first = NamelistFile(path=path)
+    second = NamelistFile(path=path)
+    first.update_from_specs({"output_nml[2]": {"output_filename": "updated", "steps": 4}})
+
+    assert [group["output_filename"] for group in first.namelist["output_nml"]] == ["first", "updated", "third"]
+    assert first.namelist["output_nml"][1]["steps"] == 4
+    assert [group["output_filename"] for group in second.namelist["output_nml"]] == ["first", "second", "third"]
+    assert "steps" not in second.namelist["output_nml"][1]
+
+    # the updated copy is dumped with all groups in order
+    dumped = tmp_path / "dumped.nml"
+    first.dump(dumped)
+    reread = NamelistFile(path=dumped).namelist["output_nml"]
+    assert [group["output_filename"] for group in reread] == ["first", "updated", "third"]
+    assert reread[1]["steps"] == 4
+
+
+def test_validate_namelist_path(tmp_path):
+    write_namelist(tmp_path / "test.nml", "&run_nml\n    nsteps = 1\n/\n")
+    assert NamelistFile._validate_namelist_path(Path("test.nml"), tmp_path) == tmp_path / "test.nml"  # noqa: SLF001
+
+
+def test_validate_namelist_path_absolute_path(tmp_path):
+    path = tmp_path / "test.nml"
+    write_namelist(path, "&run_nml\n    nsteps = 1\n/\n")
+    with pytest.raises(ValueError, match=r"must be relative with respect to config file"):
+        NamelistFile._validate_namelist_path(path, tmp_path)  # noqa: SLF001
+
+
+@pytest.mark.parametrize("config_path", ["missing.nml", "test.nml/other.nml"])
+def test_validate_namelist_path_missing(tmp_path, config_path):
+    write_namelist(tmp_path / "test.nml", "&run_nml\n    nsteps = 1\n/\n")
+    with pytest.raises(FileNotFoundError, match=r"does not exist"):
+        NamelistFile._validate_namelist_path(Path(config_path), tmp_path)  # noqa: SLF001
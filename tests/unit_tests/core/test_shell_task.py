@@ -0,0 +1,36 @@
+from pathlib import Path
+
+import pytest
+
+from sirocco.core._tasks.shell_task import ShellTask
+
+
+def test_validate_src(tmp_path):
+    (tmp_path / "script.sh").write_text("echo hello\n")
+    assert ShellTask._validate_src(Path("script.sh"), tmp_path) == tmp_path / "script.sh"  # noqa: SLF001
+
+
+def test_validate_src_absolute_path(tmp_path):
+    # ConfigShellTask already rejects absolute paths, the task checks it again for direct use
+    script = tmp_path / "script.sh"
+    script.write_text("echo hello\n")
+    with pytest.raises(ValueError, match=r"must be relative with respect to config file"):
+        ShellTask._validate_src(script, tmp_path)  # noqa: SLF001
+
+
+def test_validate_src_missing_script(tmp_path):
+    with pytest.raises(FileNotFoundError, match=r"script.sh does not exist"):
+        ShellTask._validate_src(Path("script.sh"), tmp_path)  # noqa: SLF001
+
+
+def test_validate_src_directory(tmp_path):
+    (tmp_path / "scripts").mkdir()
+    with pytest.raises(OSError, match=r"scripts is not a file"):
+        ShellTask._validate_src(Path("scripts"), tmp_path)  # noqa: SLF001
+
+
+def test_validate_src_unreachable_path(tmp_path):
+    # a file used as a directory raises ENOTDIR, reported as missing like Path.exists() did
+    (tmp_path / "script.sh").write_text("echo hello\n")
+    with pytest.raises(FileNotFoundError, match=r"does not exist"):
+        ShellTask._validate_src(Path("script.sh/other.sh"), tmp_path)  # noqa: SLF001
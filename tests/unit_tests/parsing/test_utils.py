@@ -0,0 +1,36 @@
+import pytest
+
+from sirocco.parsing._utils import walltime_to_seconds
+
+
+@pytest.mark.parametrize(
+    ("walltime", "expected"),
+    [
+        ("00:05:00", 300),
+        ("1:2:3", 3723),
+        ("23:59:59", 86399),
+        ("00:00:00", 0),
+    ],
+)
+def test_walltime_to_seconds(walltime, expected):
+    assert walltime_to_seconds(walltime) == expected
+
+
+@pytest.mark.parametrize(
+    "walltime",
+    [
+        "24:00:00",
+        "00:60:00",
+        "00:00:60",
+        "00:00:61",
+        "000:05:00",
+        " 00:05:00",
+        "00:05",
+        "00:05:00:00",
+        "-1:05:00",
+        "００:05:00",  # full width zeros
+    ],
+)
+def test_walltime_to_seconds_invalid(walltime):
+    with pytest.raises(ValueError, match=r"Invalid time format .* Expected HH:MM:SS format."):
+        walltime_to_seconds(walltime)
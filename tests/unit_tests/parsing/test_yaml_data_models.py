@@ -32,3 +32,14 @@ def test_from_config_file_is_empty(tmp_path):
     empty_file.write_text("")
     with pytest.raises(ValueError, match=r".*empty_file is empty.*"):
         _ = models.ConfigWorkflow.from_config_file(empty_file)
+
+
+def test_task_walltime_valid():
+    assert models.ConfigRootTask(name="ROOT", computer="localhost", walltime="1:02:03").walltime == "1:02:03"
+
+
+# leap seconds 60 and 61 were accepted by time.strptime but cannot be converted later on
+@pytest.mark.parametrize("walltime", ["24:00:00", "00:00:60", "00:00:61", "00:05", "000:05:00"])
+def test_task_walltime_invalid(walltime):
+    with pytest.raises(ValueError, match=r"walltime must be in HH:MM:SS format"):
+        models.ConfigRootTask(name="ROOT", computer="localhost", walltime=walltime)